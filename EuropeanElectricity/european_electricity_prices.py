@@ -1,17 +1,26 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
 import polars as pl
 
 
-def load_price_data(data_dir: Path) -> pl.DataFrame:
+# Allow running as a standalone script (uv run EuropeanElectricity/european_electricity_prices.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.pipeline import write_json_with_newline
+
+
+def load_price_data(data_dir: Path) -> pl.LazyFrame | None:
     csv_path = data_dir / "all_countries.csv"
     if not csv_path.exists():
         print(f"✗ File not found: {csv_path}")
         return None
 
+    # Scan lazily so parsing, derived columns and the sort run as one optimized plan
     print(f"Loading price data from {csv_path}...")
-    df = pl.read_csv(
+    return pl.scan_csv(
         csv_path,
         schema_overrides={
             "Datetime (UTC)": pl.Utf8,
@@ -19,36 +28,30 @@ def load_price_data(data_dir: Path) -> pl.DataFrame:
             "Price (EUR/MWhe)": pl.Float64,
         },
     )
-    print(f"✓ Loaded {len(df):,} rows")
-    return df
 
 
-def process_price_data(df: pl.DataFrame) -> pl.DataFrame:
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def process_price_data(lf: pl.LazyFrame) -> pl.DataFrame:
+    # Both timestamp columns share one fixed layout; passing it avoids format inference
+    utc = pl.col("Datetime (UTC)").str.to_datetime(DATETIME_FORMAT, strict=True, exact=True)
     df = (
-        df.with_columns(
-            pl.col("Datetime (UTC)").str.to_datetime().alias("Datetime (UTC)"),
-            pl.col("Datetime (Local)").str.to_datetime().alias("Datetime (Local)"),
-        )
-        .with_columns(
-            pl.col("Datetime (UTC)").dt.year().cast(pl.Int32).alias("Year"),
-            pl.col("Datetime (UTC)").dt.month().cast(pl.Int8).alias("Month"),
-            pl.col("Datetime (UTC)").dt.day().cast(pl.Int8).alias("Day"),
-            pl.col("Datetime (UTC)").dt.hour().cast(pl.Int8).alias("Hour"),
-        )
-        .select(
-            [
-                "Country",
-                "ISO3 Code",
-                "Datetime (UTC)",
-                "Datetime (Local)",
-                "Price (EUR/MWhe)",
-                "Year",
-                "Month",
-                "Day",
-                "Hour",
-            ]
+        lf.select(
+            "Country",
+            "ISO3 Code",
+            utc.alias("Datetime (UTC)"),
+            pl.col("Datetime (Local)")
+            .str.to_datetime(DATETIME_FORMAT, strict=True, exact=True)
+            .alias("Datetime (Local)"),
+            "Price (EUR/MWhe)",
+            utc.dt.year().cast(pl.Int16).alias("Year"),
+            utc.dt.month().cast(pl.Int8).alias("Month"),
+            utc.dt.day().cast(pl.Int8).alias("Day"),
+            utc.dt.hour().cast(pl.Int8).alias("Hour"),
         )
         .sort("Datetime (UTC)", "Country")
+        .collect(engine="streaming")
     )
 
     print(f"✓ Processed {len(df):,} rows — {df['Country'].n_unique()} countries")
@@ -72,16 +75,16 @@ def export_data(df: pl.DataFrame, output_dir: Path) -> bool:
             pl.col("Datetime (UTC)").cast(pl.Utf8),
             pl.col("Datetime (Local)").cast(pl.Utf8),
         )
-        df_csv.write_csv(csv_file)
-        print(f"✓ CSV exported: {csv_file}")
 
-        df.write_json(json_file)
-        with open(json_file, "a") as f:
-            f.write("\n")
-        print(f"✓ JSON exported: {json_file}")
-
-        df.write_parquet(parquet_file)
-        print(f"✓ Parquet exported: {parquet_file}")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            exports = [
+                ("CSV", csv_file, executor.submit(df_csv.write_csv, csv_file)),
+                ("JSON", json_file, executor.submit(write_json_with_newline, df, json_file)),
+                ("Parquet", parquet_file, executor.submit(df.write_parquet, parquet_file)),
+            ]
+            for label, path, future in exports:
+                future.result()
+                print(f"✓ {label} exported: {path}")
 
         return True
     except Exception as e:
@@ -95,10 +98,14 @@ def display_summary(df: pl.DataFrame):
     print(f"{'=' * 80}")
     print(f"Total Rows: {len(df):,}")
     print(f"Countries: {df['Country'].n_unique()}")
-    print(f"Date Range: {df['Datetime (UTC)'].min()} to {df['Datetime (UTC)'].max()}")
-    print(
-        f"Price Range: {df['Price (EUR/MWhe)'].min():.2f} - {df['Price (EUR/MWhe)'].max():.2f} EUR/MWhe"
-    )
+    date_min, date_max, price_min, price_max = df.select(
+        pl.col("Datetime (UTC)").min().alias("date_min"),
+        pl.col("Datetime (UTC)").max().alias("date_max"),
+        pl.col("Price (EUR/MWhe)").min().alias("price_min"),
+        pl.col("Price (EUR/MWhe)").max().alias("price_max"),
+    ).row(0)
+    print(f"Date Range: {date_min} to {date_max}")
+    print(f"Price Range: {price_min:.2f} - {price_max:.2f} EUR/MWhe")
     print(f"Columns: {df.columns}")
     print(f"Schema:\n{df.schema}")
 
@@ -112,11 +119,11 @@ def main():
     script_dir = Path(__file__).parent
     data_dir = script_dir / "european_wholesale_electricity_price_data_hourly"
 
-    df = load_price_data(data_dir)
-    if df is None:
+    lf = load_price_data(data_dir)
+    if lf is None:
         return
 
-    df = process_price_data(df)
+    df = process_price_data(lf)
     display_summary(df)
 
     print(f"\n{'=' * 80}")
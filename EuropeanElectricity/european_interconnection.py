@@ -1,9 +1,18 @@
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
 import polars as pl
 
 
+# Allow running as a standalone script (uv run EuropeanElectricity/european_interconnection.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.pipeline import write_json_with_newline, write_parquet_export
+
+
 def load_peak_demand(data_dir: Path) -> pl.DataFrame:
     path = data_dir / "peak_demand.csv"
     df = pl.read_csv(path)
@@ -12,7 +21,7 @@ def load_peak_demand(data_dir: Path) -> pl.DataFrame:
         on=["2024", "2030", "2040"],
         variable_name="Year",
         value_name="Peak Demand (MW)",
-    ).with_columns(pl.col("Year").cast(pl.Int32))
+    ).with_columns(pl.col("Year").cast(pl.Int16))
     print(f"  ✓ peak_demand: {len(df)} rows")
     return df.with_columns(pl.lit("peak_demand").alias("Category"))
 
@@ -27,11 +36,12 @@ def load_interconnectors(data_dir: Path) -> pl.DataFrame:
         ("Needs", "NEEDS_NTC.csv"),
     ]:
         path = interconn_dir / file_name
-        df = pl.read_csv(path, schema_overrides=schema).with_columns(
+        lf = pl.scan_csv(path, schema_overrides=schema).with_columns(
             pl.lit(scenario).alias("Scenario")
         )
-        parts.append(df)
-    df = pl.concat(parts)
+        parts.append(lf)
+    # One plan for all three scenario files; Polars parses them in parallel on collect
+    df = pl.concat(parts).collect()
     print(f"  ✓ interconnectors: {len(df)} rows")
     return df.with_columns(pl.lit("interconnector").alias("Category"))
 
@@ -41,15 +51,14 @@ def load_import_potential(data_dir: Path) -> pl.DataFrame:
     parts = []
     for year in [2030, 2040]:
         path = imp_dir / f"imp_pot_chart_{year}.csv"
-        df = pl.read_csv(path)
-        df = df.unpivot(
+        lf = pl.scan_csv(path).unpivot(
             index="Country",
             on=["2024", "Reference", "Projects", "Needs"],
             variable_name="Scenario",
             value_name="Import Potential (%)",
-        ).with_columns(pl.lit(year).alias("Target Year"))
-        parts.append(df)
-    df = pl.concat(parts)
+        )
+        parts.append(lf.with_columns(pl.lit(year).alias("Target Year")))
+    df = pl.concat(parts).collect()
     print(f"  ✓ import_potential: {len(df)} rows")
     return df.with_columns(pl.lit("import_potential").alias("Category"))
 
@@ -159,70 +168,95 @@ def load_flow_indicators(data_dir: Path) -> pl.DataFrame:
     return df.with_columns(pl.lit("flow_indicator").alias("Category"))
 
 
+LOADERS = {
+    "peak_demand": load_peak_demand,
+    "interconnectors": load_interconnectors,
+    "import_potential": load_import_potential,
+    "country_indicators": load_country_indicators,
+    "flow_indicators": load_flow_indicators,
+}
+
+
 def load_all_interconnection_data(data_dir: Path) -> dict[str, pl.DataFrame]:
     print("Loading interconnection data...")
-    return {
-        "peak_demand": load_peak_demand(data_dir),
-        "interconnectors": load_interconnectors(data_dir),
-        "import_potential": load_import_potential(data_dir),
-        "country_indicators": load_country_indicators(data_dir),
-        "flow_indicators": load_flow_indicators(data_dir),
-    }
+    # The loaders read disjoint files and Polars releases the GIL while parsing
+    with ThreadPoolExecutor(max_workers=len(LOADERS)) as executor:
+        futures = {name: executor.submit(loader, data_dir) for name, loader in LOADERS.items()}
+        return {name: future.result() for name, future in futures.items()}
 
 
 def export_datasets(datasets: dict[str, pl.DataFrame], output_dir: Path):
     csv_dir = output_dir / "csv"
     json_dir = output_dir / "json"
     parquet_dir = output_dir / "parquet"
-
-    for d in [csv_dir, json_dir, parquet_dir]:
+    combined_dir = output_dir / "combined"
+    combined_dir_csv = combined_dir / "csv"
+    combined_dir_json = combined_dir / "json"
+    combined_dir_parquet = combined_dir / "parquet"
+
+    for d in [
+        csv_dir,
+        json_dir,
+        parquet_dir,
+        combined_dir_csv,
+        combined_dir_json,
+        combined_dir_parquet,
+    ]:
         d.mkdir(parents=True, exist_ok=True)
 
     all_ok = True
-    for name, df in datasets.items():
-        try:
-            csv_path = csv_dir / f"{name}.csv"
-            json_path = json_dir / f"{name}.json"
-            parquet_path = parquet_dir / f"{name}.parquet"
-
-            df.write_csv(csv_path)
-            print(f"  ✓ {name}.csv")
-
-            df.write_json(json_path)
-            with open(json_path, "a") as f:
-                f.write("\n")
-            print(f"  ✓ {name}.json")
-
-            df.write_parquet(parquet_path)
-            print(f"  ✓ {name}.parquet")
-        except Exception as e:
-            print(f"  ✗ {name}: {e}")
-            all_ok = False
+    exported = set()
+    # Every (dataset, format) write is independent; submit them all up front and
+    # report in the original order
+    with ThreadPoolExecutor() as executor:
+        writes = {
+            name: [
+                (f"{name}.csv", executor.submit(df.write_csv, csv_dir / f"{name}.csv")),
+                (
+                    f"{name}.json",
+                    executor.submit(write_json_with_newline, df, json_dir / f"{name}.json"),
+                ),
+                (
+                    f"{name}.parquet",
+                    executor.submit(write_parquet_export, df, parquet_dir / f"{name}.parquet"),
+                ),
+            ]
+            for name, df in datasets.items()
+        }
+        for name, futures in writes.items():
+            try:
+                for file_name, future in futures:
+                    future.result()
+                    print(f"  ✓ {file_name}")
+                exported.add(name)
+            except Exception as e:
+                print(f"  ✗ {name}: {e}")
+                all_ok = False
 
-    combined_dir = output_dir / "combined"
-    combined_dir.mkdir(exist_ok=True)
     try:
-        combined_dir_csv = combined_dir / "csv"
-        combined_dir_json = combined_dir / "json"
-        combined_dir_parquet = combined_dir / "parquet"
-        for d in [combined_dir_csv, combined_dir_json, combined_dir_parquet]:
-            d.mkdir(parents=True, exist_ok=True)
-
+        # combined/csv mirrors csv/ byte for byte, so copy the files just written
+        # instead of serializing every dataset to CSV a second time
         for name, df in datasets.items():
-            df.write_csv(combined_dir_csv / f"{name}.csv")
+            if name in exported:
+                shutil.copyfile(csv_dir / f"{name}.csv", combined_dir_csv / f"{name}.csv")
+            else:
+                df.write_csv(combined_dir_csv / f"{name}.csv")
 
         combined_json = combined_dir_json / "all_interconnection_data.json"
         combined_parquet = combined_dir_parquet / "all_interconnection_data.parquet"
+        csv_combined = combined_dir_csv / "all_interconnection_data.csv"
         all_data = pl.concat(list(datasets.values()), how="diagonal_relaxed")
         print(f"  ✓ Combined {len(all_data):,} rows across all categories")
 
-        all_data.write_json(combined_json)
-        with open(combined_json, "a") as f:
-            f.write("\n")
-        all_data.write_parquet(combined_parquet)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(write_json_with_newline, all_data, combined_json),
+                executor.submit(write_parquet_export, all_data, combined_parquet),
+                executor.submit(all_data.write_csv, csv_combined),
+            ]
+            for future in futures:
+                future.result()
 
-        csv_combined = combined_dir_csv / "all_interconnection_data.csv"
-        all_data.write_csv(csv_combined)
         for f in [combined_json, combined_parquet, csv_combined]:
             size_mb = f.stat().st_size / (1024 * 1024)
             print(f"  ✓ {f.name} ({size_mb:.2f} MB)")
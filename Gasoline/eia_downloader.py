@@ -30,13 +30,28 @@ Products Available:
 
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from urllib.parse import urlencode
 
 import polars as pl
 import requests
 from dotenv import load_dotenv
 
+
+# Allow running as a standalone script (uv run Gasoline/eia_downloader.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.pipeline import (
+    _create_session,
+    read_legacy_tracker,
+    write_json_with_newline,
+    write_parquet_export,
+)
+
+
 # Load API key from .env file
 load_dotenv()
 EIA_API_KEY = os.getenv("API_KEY")
@@ -46,6 +61,10 @@ if not EIA_API_KEY:
 
 BASE_URL = "https://api.eia.gov/v2"
 
+
+# Shared keep-alive session so the product lookup and data download reuse one connection
+_SESSION = _create_session()
+
 # Product mapping for easier reference
 ENERGY_PRODUCTS = {
     "EPCWTI": "WTI Crude Oil",
@@ -85,7 +104,7 @@ def get_available_products() -> dict:
     try:
         url = f"{BASE_URL}/petroleum/pri/spt/facet/product?api_key={EIA_API_KEY}"
         print("Fetching available products from EIA API...")
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -144,20 +163,27 @@ def download_eia_data(
         JSON response as string or None if request fails
     """
     try:
-        url = f"{BASE_URL}/{route}/data?api_key={EIA_API_KEY}&data[]={data_field}"
+        # Collect the query as (key, value) pairs and encode it in a single pass
+        # instead of growing the URL string once per facet value
+        params: list[tuple[str, str]] = [("api_key", EIA_API_KEY or ""), ("data[]", data_field)]
 
         # Add frequency if specified
         if frequency:
-            url += f"&frequency={frequency}"
+            params.append(("frequency", frequency))
 
         # Add facets if provided
         if facets:
-            for facet_name, facet_values in facets.items():
-                for value in facet_values:
-                    url += f"&facets[{facet_name}][]={value}"
+            params.extend(
+                (f"facets[{facet_name}][]", value)
+                for facet_name, facet_values in facets.items()
+                for value in facet_values
+            )
 
         # Sort by period descending to get latest data first
-        url += "&sort[0][column]=period&sort[0][direction]=desc"
+        params += [("sort[0][column]", "period"), ("sort[0][direction]", "desc")]
+
+        # Keep brackets literal so the URL matches what the EIA docs show
+        url = f"{BASE_URL}/{route}/data?{urlencode(params, safe='[]')}"
 
         product_display = ""
         if facets and "product" in facets:
@@ -169,7 +195,7 @@ def download_eia_data(
             )
 
         print(f"Downloading energy prices from EIA API{product_display}...")
-        response = requests.get(url, timeout=60)
+        response = _SESSION.get(url, timeout=60)
         response.raise_for_status()
 
         print(f"✓ Data downloaded successfully (Status: {response.status_code})")
@@ -215,59 +241,31 @@ def parse_eia_json_data(
             print("✗ No data points in response")
             return None
 
-        # Extract relevant fields including product and series info
-        records = []
-        for item in data_list:
-            product_id = item.get("product", "Unknown")
-            series_id = item.get("series", "Unknown")
-            product_name = (
-                product_names.get(product_id, product_id) if product_names else product_id
-            )
-            series_name = series_names.get(series_id, series_id) if series_names else series_id
-
-            record = {
-                "Date": item.get("period"),
-                "Price": item.get("value"),
-                "Product": product_name,
-                "ProductID": product_id,
-                "Series": series_name,
-                "SeriesID": series_id,
-            }
-            records.append(record)
-
-        # Create DataFrame with Polars
-        df_pd = pl.DataFrame(records)
-
-        # Normalize data types
-        df = (
-            df_pd.with_columns(
-                [
-                    pl.col("Date").str.to_date().alias("Date"),
-                    pl.col("Price").cast(pl.Float64).alias("Price"),
-                ]
-            )
-            .with_columns(
-                [
-                    pl.col("Date").dt.year().cast(pl.Int32).alias("Year"),
-                    pl.col("Date").dt.month().cast(pl.Int8).alias("Month"),
-                    pl.col("Date").dt.day().cast(pl.Int8).alias("Day"),
-                ]
-            )
-            .drop_nulls()
-            .select(
-                [
-                    "Date",
-                    "Product",
-                    "ProductID",
-                    "Series",
-                    "SeriesID",
-                    "Price",
-                    "Year",
-                    "Month",
-                    "Day",
-                ]
-            )
+        # Build the frame straight from the records, keeping only the fields we use;
+        # product/series names are mapped with vectorized replace instead of per-row lookups
+        raw = pl.from_dicts(
+            data_list,
+            schema={"period": pl.Utf8, "value": pl.Utf8, "product": pl.Utf8, "series": pl.Utf8},
+            strict=False,
         )
+        # Records with a null product or series are dropped by drop_nulls() below, as before
+        product_id = pl.col("product")
+        series_id = pl.col("series")
+
+        # Normalize data types, parsing Date once for the derived date parts
+        # Daily EIA periods are ISO dates; an explicit format skips pattern inference
+        date = pl.col("period").str.to_date(format="%Y-%m-%d", strict=True, exact=True)
+        df = raw.select(
+            date.alias("Date"),
+            product_id.replace(product_names or {}).alias("Product"),
+            product_id.alias("ProductID"),
+            series_id.replace(series_names or {}).alias("Series"),
+            series_id.alias("SeriesID"),
+            pl.col("value").cast(pl.Float64).alias("Price"),
+            date.dt.year().cast(pl.Int16).alias("Year"),
+            date.dt.month().cast(pl.Int8).alias("Month"),
+            date.dt.day().cast(pl.Int8).alias("Day"),
+        ).drop_nulls()
 
         print(f"✓ JSON parsed successfully - {len(df)} rows")
         return df
@@ -276,74 +274,96 @@ def parse_eia_json_data(
         return None
 
 
-def append_to_csv(csv_file_path: str, new_df: pl.DataFrame) -> pl.DataFrame:
+def append_to_csv(tracker_file_path: str, new_df: pl.DataFrame) -> tuple[pl.DataFrame, bool]:
     """
-    Append new data to existing CSV file, keeping only new records.
-    Deduplicates by Date and Product combination.
+    Append new data to the Parquet tracker file, keeping only new records.
+    Deduplicates by Date and Series combination.
 
     Args:
-        csv_file_path: Path to CSV file
+        tracker_file_path: Path to Parquet tracker file
         new_df: New dataframe to append
 
     Returns:
-        Combined dataframe
+        Tuple of the combined dataframe and whether new records were added
+
+    When only the legacy CSV tracker (same stem, `.csv`) exists, it seeds the Parquet
+    tracker once and is removed after the Parquet tracker has been written.
     """
-    csv_path = Path(csv_file_path)
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    tracker_path = Path(tracker_file_path)
+    legacy_path = tracker_path.with_suffix(".csv")
+    tracker_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if csv_path.exists() and csv_path.stat().st_size > 0:
+    has_tracker = tracker_path.exists() and tracker_path.stat().st_size > 0
+    migrating = not has_tracker and legacy_path.exists() and legacy_path.stat().st_size > 0
+    if has_tracker or migrating:
         try:
-            existing_df = pl.read_csv(csv_path)
-            existing_df = existing_df.with_columns(pl.col("Date").str.to_date())
-            print(f"✓ Existing file loaded - {len(existing_df)} rows")
-
-            # Create composite keys for deduplication (Date + Series for granular tracking)
-            existing_keys = set(
-                zip(existing_df["Date"].to_list(), existing_df["Series"].to_list(), strict=False)
-            )
-            new_keys = set(zip(new_df["Date"].to_list(), new_df["Series"].to_list(), strict=False))
-
-            missing_keys = new_keys - existing_keys
-
-            if missing_keys:
-                missing_dates_series = [(d, s) for d, s in missing_keys]
-                new_records = new_df.filter(
-                    pl.struct(["Date", "Series"]).is_in([pl.lit(k) for k in missing_dates_series])
+            if migrating:
+                # Keep the tracker's usual order (newest first within each series)
+                existing_lf = (
+                    read_legacy_tracker(
+                        legacy_path, series_columns=("Product", "ProductID", "Series", "SeriesID")
+                    )
+                    .lazy()
+                    .sort(["Series", "Date"], descending=[False, True])
+                )
+                print(f"✓ Migrating legacy CSV tracker {legacy_path}")
+            else:
+                # Trackers written before Year was narrowed from Int32 are cast on read
+                existing_lf = pl.scan_parquet(tracker_path).cast({"Year": pl.Int16})
+            print(f"✓ Existing file loaded - {existing_lf.select(pl.len()).collect().item()} rows")
+
+            # Deduplicate on the composite key (Date + Series for granular tracking),
+            # reading only the key columns from the tracker
+            existing_keys = existing_lf.select(["Date", "Series"]).collect()
+            new_records = new_df.join(existing_keys, on=["Date", "Series"], how="anti")
+
+            has_new = new_records.height > 0
+            if has_new:
+                print(f"✓ Found {new_records.height} new records to add")
+
+                combined_df = (
+                    pl.concat([existing_lf, new_records.lazy()])
+                    .sort(["Series", "Date"], descending=[False, True])
+                    .collect()
                 )
-                print(f"✓ Found {len(new_records)} new records to add")
-
-                combined_df = pl.concat([existing_df, new_records])
-                combined_df = combined_df.sort(["Series", "Date"], descending=[False, True])
             else:
                 print("✓ No new records to add - data is up to date")
-                combined_df = existing_df
+                combined_df = existing_lf.collect()
 
             print(f"✓ Combined data - {len(combined_df)} total rows")
         except Exception as e:
             print(f"✗ Error reading existing file: {e}")
             print("  → Creating new dataset with downloaded data")
+            migrating = False
+            has_new = True
             combined_df = new_df.sort(["Series", "Date"], descending=[False, True])
     else:
         print("✓ Creating new dataset")
+        has_new = True
         combined_df = new_df.sort(["Series", "Date"], descending=[False, True])
 
-    try:
-        combined_df_str = combined_df.with_columns(pl.col("Date").cast(pl.Utf8))
-        combined_df_str.write_csv(csv_path)
-        print(f"✓ Data tracker saved to {csv_path}")
-    except Exception as e:
-        print(f"✗ Error saving tracker file: {e}")
+    if has_new or migrating:
+        try:
+            combined_df.write_parquet(tracker_path, compression="zstd", compression_level=3)
+            print(f"✓ Data tracker saved to {tracker_path}")
+            if migrating:
+                legacy_path.unlink()
+                print(f"✓ Removed legacy CSV tracker {legacy_path}")
+        except Exception as e:
+            print(f"✗ Error saving tracker file: {e}")
 
-    return combined_df
+    return combined_df, has_new
 
 
-def export_data(df: pl.DataFrame, output_dir: str) -> bool:
+def export_data(df: pl.DataFrame, output_dir: str, changed: bool = True) -> bool:
     """
     Export data to CSV, JSON, and Parquet formats.
 
     Args:
         df: DataFrame to export
         output_dir: Output directory
+        changed: Whether the data changed since the last run; existing exports are
+            left untouched when False
 
     Returns:
         True if successful, False otherwise
@@ -362,18 +382,23 @@ def export_data(df: pl.DataFrame, output_dir: str) -> bool:
     json_file = json_dir / "eia_energy_prices.json"
     parquet_file = parquet_dir / "eia_energy_prices.parquet"
 
+    # Nothing new since the last run and every export already exists - keep the files as-is
+    if not changed and all(f.exists() for f in (csv_file, json_file, parquet_file)):
+        print("✓ Exports already up to date - skipping rewrite")
+        return True
+
     try:
         df_csv = df.with_columns(pl.col("Date").cast(pl.Utf8))
-        df_csv.write_csv(csv_file)
-        print(f"✓ CSV exported to {csv_file}")
-
-        df.write_json(json_file)
-        with open(json_file, "a") as f:
-            f.write("\n")
-        print(f"✓ JSON exported to {json_file}")
 
-        df.write_parquet(parquet_file)
-        print(f"✓ Parquet exported to {parquet_file}")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            exports = [
+                ("CSV", csv_file, executor.submit(df_csv.write_csv, csv_file)),
+                ("JSON", json_file, executor.submit(write_json_with_newline, df, json_file)),
+                ("Parquet", parquet_file, executor.submit(write_parquet_export, df, parquet_file)),
+            ]
+            for label, path, future in exports:
+                future.result()
+                print(f"✓ {label} exported to {path}")
 
         # Count unique products and series
         unique_series = df["Series"].unique().len()
@@ -406,14 +431,23 @@ def display_sample_data(df: pl.DataFrame, n: int = 10) -> None:
     print(f"Total Rows: {len(df)}")
     print(f"Columns: {df.columns}")
     unique_products = df["Product"].unique().len()
-    unique_series = df["Series"].unique().len()
+    # Deduplicate Series once; only the five names shown are converted to Python strings
+    series_names = df["Series"].unique()
+    unique_series = series_names.len()
     print(f"Unique Products: {unique_products}")
     print(f"Unique Series/Locations: {unique_series}")
-    print(f"Series: {', '.join(df['Series'].unique().to_list()[:5])}")
+    print(f"Series: {', '.join(series_names.head(5).to_list())}")
     if unique_series > 5:
         print(f"  ... and {unique_series - 5} more")
-    print(f"Date Range: {df['Date'].min()} to {df['Date'].max()}")
-    print(f"Price Range: ${df['Price'].min():.2f} - ${df['Price'].max():.2f}")
+    # Compute all four range bounds in one aggregation pass
+    date_min, date_max, price_min, price_max = df.select(
+        pl.col("Date").min().alias("date_min"),
+        pl.col("Date").max().alias("date_max"),
+        pl.col("Price").min().alias("price_min"),
+        pl.col("Price").max().alias("price_max"),
+    ).row(0)
+    print(f"Date Range: {date_min} to {date_max}")
+    print(f"Price Range: ${price_min:.2f} - ${price_max:.2f}")
     print(f"Data Types:\n{df.schema}")
     print("=" * 80 + "\n")
 
@@ -473,16 +507,16 @@ def main():
     # Step 5: Append to existing data
     print("\nStep 5: Appending to existing data...")
     script_dir = Path(__file__).parent
-    csv_file = script_dir / "eia_energy_prices.csv"
+    tracker_file = script_dir / "eia_energy_prices.parquet"
 
-    combined_df = append_to_csv(str(csv_file), df)
+    combined_df, has_new = append_to_csv(str(tracker_file), df)
 
     # Step 6: Export data
     print("\nStep 6: Exporting data...")
     print("=" * 80)
     print("Exporting Data")
     print("=" * 80)
-    export_data(combined_df, str(script_dir))
+    export_data(combined_df, str(script_dir), changed=has_new)
 
     print()
     print("=" * 80)
@@ -0,0 +1,3 @@
+"""Shared download → parse → append → export pipeline for daily FRED price series."""
+
+from common.pipeline import SeriesSource, run
@@ -0,0 +1,413 @@
+"""
+Daily Price Series Pipeline
+
+Shared download → parse → append → export skeleton for single-value daily series
+published by FRED (Federal Reserve Economic Data) as CSV. Each dataset script only
+declares a `SeriesSource` and calls `run(source)`.
+
+Output layout (relative to `SeriesSource.output_dir`):
+    <basename>.parquet          # Data tracker (for duplicate detection)
+    .etag                       # ETag of the last processed download
+    csv/<basename>.csv
+    json/<basename>.json
+    parquet/<basename>.parquet
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+
+
+@dataclass(frozen=True)
+class SeriesSource:
+    """Description of one daily FRED price series and where its outputs live."""
+
+    name: str  # Human-readable series name, e.g. "Crude Oil Brent"
+    title: str  # Banner printed at the top of a run
+    series_id: str  # FRED series id, also the value column in the CSV
+    output_basename: str  # File stem for the tracker and exports
+    output_dir: Path  # Dataset folder (usually the calling script's directory)
+    unit_label: str  # Suffix for the price range summary, e.g. "per barrel"
+
+    @property
+    def url(self) -> str:
+        return f"{FRED_CSV_URL}?id={self.series_id}"
+
+    @property
+    def tracker_file(self) -> Path:
+        return self.output_dir / f"{self.output_basename}.parquet"
+
+    @property
+    def etag_file(self) -> Path:
+        return self.output_dir / ".etag"
+
+    @property
+    def export_files(self) -> tuple[Path, Path, Path]:
+        """CSV, JSON and Parquet export paths, in that order."""
+        basename = self.output_basename
+        return (
+            self.output_dir / "csv" / f"{basename}.csv",
+            self.output_dir / "json" / f"{basename}.json",
+            self.output_dir / "parquet" / f"{basename}.parquet",
+        )
+
+
+# Value columns of the CSV trackers written before the switch to Parquet; they follow
+# Date and any series columns
+_LEGACY_VALUE_SCHEMA = {
+    "Price": pl.Float64,
+    "Year": pl.Int16,
+    "Month": pl.Int8,
+    "Day": pl.Int8,
+}
+
+
+class NotModified:
+    """Marker returned by `download_series` when FRED answers 304 Not Modified."""
+
+
+NOT_MODIFIED = NotModified()
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with retries (FRED downloads and the EIA API)."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = (
+        "KaggleDataset/0.1 (+https://github.com/deepu-peddineni/KaggleDataset)"
+    )
+    return session
+
+
+# Shared keep-alive session so repeated downloads reuse the TCP/TLS connection
+_SESSION = _create_session()
+
+
+def _read_etag(source: SeriesSource) -> str | None:
+    """Return the ETag of the last processed download, if its outputs all still exist."""
+    # A 304 skips the tracker update and the exports, so only send If-None-Match while
+    # the tracker and every export are there; otherwise fetch in full to rebuild them
+    if not all(f.exists() for f in (source.tracker_file, *source.export_files)):
+        return None
+    try:
+        return source.etag_file.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _save_etag(source: SeriesSource, etag: str | None) -> None:
+    """Persist the ETag once its payload has been merged into the tracker."""
+    if not etag:
+        return
+    try:
+        source.etag_file.write_text(f"{etag}\n")
+    except OSError as e:
+        print(f"✗ Error saving ETag: {e}")
+
+
+def download_series(
+    source: SeriesSource, etag: str | None = None
+) -> tuple[bytes | NotModified | None, str | None]:
+    """Download the series from FRED (CSV format).
+
+    Sends `If-None-Match` when a previous ETag is known. Returns the payload (or
+    `NOT_MODIFIED` on a 304, or None on failure) together with the response ETag.
+    """
+    try:
+        print(f"Downloading {source.name} data from FRED...")
+        headers = {"If-None-Match": etag} if etag else {}
+        # Stream the body into a single buffer instead of holding chunk list + joined copy
+        with _SESSION.get(source.url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 304:
+                print("✓ Data unchanged since last run (Status: 304)")
+                return NOT_MODIFIED, etag
+            response.raise_for_status()
+            buf = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buf.write(chunk)
+        print(f"✓ Data downloaded successfully (Status: {response.status_code})")
+        return buf.getvalue(), response.headers.get("ETag")
+    except requests.RequestException as e:
+        print(f"✗ Error downloading data: {e}")
+        return None, None
+
+
+def parse_csv_data(source: SeriesSource, csv_content: bytes) -> pl.DataFrame | None:
+    """Parse FRED CSV content into Date, Price, Year, Month, Day columns."""
+    try:
+        # Parse the raw response bytes with an explicit schema (no decode, no inference)
+        df = pl.read_csv(
+            csv_content,
+            schema={"observation_date": pl.String, source.series_id: pl.Float64},
+            null_values=".",
+        ).rename({"observation_date": "Date", source.series_id: "Price"})
+
+        # Missing prices arrive as nulls via the schema; only Price needs filtering.
+        # Parse Date once and derive the date parts in the same plan (CSE shares the parse);
+        # FRED always publishes ISO dates, so give the format instead of letting Polars infer it
+        date = pl.col("Date").str.to_date(format="%Y-%m-%d", strict=True, exact=True)
+        df = df.filter(pl.col("Price").is_not_null()).select(
+            date.alias("Date"),
+            pl.col("Price").cast(pl.Float64).alias("Price"),
+            date.dt.year().cast(pl.Int16).alias("Year"),
+            date.dt.month().cast(pl.Int8).alias("Month"),
+            date.dt.day().cast(pl.Int8).alias("Day"),
+        )
+
+        print(f"✓ CSV parsed successfully - {len(df)} rows")
+        return df
+    except Exception as e:
+        print(f"✗ Error parsing CSV: {e}")
+        return None
+
+
+def read_legacy_tracker(csv_path: Path, series_columns: tuple[str, ...] = ()) -> pl.DataFrame:
+    """Load a legacy CSV tracker (stored newest first) with an explicit schema.
+
+    `series_columns` are the string columns stored between Date and Price that identify
+    the series of each row (none for a single-series tracker). Rows come back in
+    ascending order of the series columns, then Date.
+    """
+    schema = {"Date": pl.String, **dict.fromkeys(series_columns, pl.String), **_LEGACY_VALUE_SCHEMA}
+    return (
+        pl.read_csv(csv_path, schema=schema)
+        .with_columns(pl.col("Date").str.to_date(format="%Y-%m-%d", strict=True, exact=True))
+        .sort([*series_columns, "Date"])
+    )
+
+
+def append_to_csv(tracker_file_path: Path, new_df: pl.DataFrame) -> tuple[pl.DataFrame, bool, bool]:
+    """Append new data to the Parquet tracker file, keeping only new records.
+
+    Returns the combined data (newest first), whether new records were added, and
+    whether the tracker on disk now holds that data (False if saving it failed).
+    When only the legacy `<basename>.csv` tracker exists, it seeds the Parquet
+    tracker once and is removed after the Parquet tracker has been written.
+    """
+    tracker_path = Path(tracker_file_path)
+    legacy_path = tracker_path.with_suffix(".csv")
+
+    # Create directory if it doesn't exist
+    tracker_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Check if file exists and has data, falling back to the legacy CSV tracker
+    has_tracker = tracker_path.exists() and tracker_path.stat().st_size > 0
+    migrating = not has_tracker and legacy_path.exists() and legacy_path.stat().st_size > 0
+    if has_tracker or migrating:
+        try:
+            if migrating:
+                existing_lf = read_legacy_tracker(legacy_path).lazy()
+                print(f"✓ Migrating legacy CSV tracker {legacy_path}")
+            else:
+                # Parquet preserves the Date/Float64/Int16/Int8 schema; the Year cast only
+                # upgrades trackers written before Year was narrowed from Int32 (no-op otherwise)
+                existing_lf = pl.scan_parquet(tracker_path).cast({"Year": pl.Int16})
+            print(f"✓ Existing file loaded - {existing_lf.select(pl.len()).collect().item()} rows")
+
+            # Find only new records, probing just the Date column of the tracker
+            existing_dates = existing_lf.select("Date").collect()
+            new_records = new_df.join(existing_dates, on="Date", how="anti")
+
+            has_new = new_records.height > 0
+            if has_new:
+                print(f"✓ Found {new_records.height} new records to add")
+
+                # The tracker is stored ascending by Date, so a linear merge of the
+                # sorted new rows replaces a full re-sort of the combined data
+                tracker_df = existing_lf.merge_sorted(
+                    new_records.sort("Date").lazy(), key="Date"
+                ).collect()
+            else:
+                print("✓ No new records to add - data is up to date")
+                tracker_df = existing_lf.collect()
+
+            print(f"✓ Combined data - {len(tracker_df)} total rows")
+        except Exception as e:
+            print(f"✗ Error reading existing file: {e}")
+            print("  → Creating new dataset with downloaded data")
+            migrating = False
+            has_new = True
+            tracker_df = new_df.sort("Date")
+    else:
+        print("✓ Creating new dataset")
+        has_new = True
+        tracker_df = new_df.sort("Date")
+
+    # Save to tracker file for next run (skipped when nothing changed, unless the
+    # legacy CSV still has to be carried over)
+    tracker_saved = not (has_new or migrating)
+    if not tracker_saved:
+        try:
+            tracker_df.write_parquet(tracker_path, compression="zstd", compression_level=3)
+            tracker_saved = True
+            print(f"✓ Data tracker saved to {tracker_path}")
+            if migrating:
+                legacy_path.unlink()
+                print(f"✓ Removed legacy CSV tracker {legacy_path}")
+        except Exception as e:
+            print(f"✗ Error saving tracker file: {e}")
+
+    # Exports are published newest-first; reversing the ascending tracker is O(N)
+    combined_df = tracker_df.reverse()
+
+    return combined_df, has_new, tracker_saved
+
+
+def write_json_with_newline(df: pl.DataFrame, json_file: Path) -> None:
+    """Write DataFrame as JSON ending with a newline, in a single file write."""
+    buf = io.BytesIO()
+    df.write_json(buf)
+    buf.write(b"\n")
+    Path(json_file).write_bytes(buf.getvalue())
+
+
+def write_parquet_export(df: pl.DataFrame, parquet_file: Path) -> None:
+    """Write a small table's Parquet export as one row group with column statistics."""
+    # The exported tables are small enough for a single row group, so readers filtering
+    # on a column (e.g. Date) can prune it from the footer statistics alone; a 1 MiB
+    # buffered handle keeps the page writes from hitting the filesystem one by one
+    with open(parquet_file, "wb", buffering=1 << 20) as f:
+        df.write_parquet(
+            f,
+            compression="zstd",
+            compression_level=3,
+            statistics=True,
+            row_group_size=max(df.height, 1),
+            data_page_size=1 << 20,
+        )
+
+
+def export_data(source: SeriesSource, df: pl.DataFrame, changed: bool = True) -> bool:
+    """Export DataFrame to CSV, JSON, and Parquet formats in respective folders."""
+    output_path = source.output_dir
+    csv_file, json_file, parquet_file = source.export_files
+
+    # Create subdirectories for each format
+    for export_file in source.export_files:
+        export_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Nothing new since the last run and every export already exists - keep the files as-is
+    if not changed and all(f.exists() for f in (csv_file, json_file, parquet_file)):
+        print("✓ Exports already up to date - skipping rewrite")
+        return True
+
+    try:
+        # Export to CSV (with proper type handling for CSV format)
+        # CSV will have Date as string, but Parquet/JSON will preserve Date type
+        df_csv = df.with_columns(pl.col("Date").cast(pl.Utf8))
+
+        # The three writers are independent and Polars releases the GIL while
+        # serializing, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            exports = [
+                ("CSV", csv_file, executor.submit(df_csv.write_csv, csv_file)),
+                # JSON preserves Date type; pre-commit requires files to end with newline
+                ("JSON", json_file, executor.submit(write_json_with_newline, df, json_file)),
+                # Parquet preserves all types including Date
+                ("Parquet", parquet_file, executor.submit(write_parquet_export, df, parquet_file)),
+            ]
+            for label, path, future in exports:
+                future.result()
+                print(f"✓ {label} exported to {path}")
+
+        # Print folder structure
+        print("\n✓ Folder Structure:")
+        print(f"  └── {output_path.name}/")
+        print("      ├── csv/")
+        print(f"      │   └── {csv_file.name} ({len(df)} rows)")
+        print("      ├── json/")
+        print(f"      │   └── {json_file.name} ({len(df)} rows)")
+        print("      └── parquet/")
+        print(f"          └── {parquet_file.name} ({len(df)} rows)")
+
+        return True
+    except Exception as e:
+        print(f"✗ Error exporting data: {e}")
+        return False
+
+
+def display_sample_data(source: SeriesSource, df: pl.DataFrame, n: int = 10) -> None:
+    """Display sample data from the DataFrame."""
+    print("\n" + "=" * 80)
+    print(f"Sample Data (First {n} rows)")
+    print("=" * 80)
+    # Sort by Date ascending to show oldest first
+    sample_df = df.sort("Date", descending=False).head(n)
+    print(sample_df)
+    print("\n" + "=" * 80)
+    print("Data Summary")
+    print("=" * 80)
+    print(f"Total Rows: {len(df)}")
+    print(f"Columns: {df.columns}")
+    # Compute all four range bounds in one aggregation pass
+    date_min, date_max, price_min, price_max = df.select(
+        pl.col("Date").min().alias("date_min"),
+        pl.col("Date").max().alias("date_max"),
+        pl.col("Price").min().alias("price_min"),
+        pl.col("Price").max().alias("price_max"),
+    ).row(0)
+    print(f"Date Range: {date_min} to {date_max}")
+    print(f"Price Range: ${price_min:.2f} - ${price_max:.2f} {source.unit_label}")
+    print(f"Data Types:\n{df.schema}")
+    print("=" * 80 + "\n")
+
+
+def run(source: SeriesSource) -> None:
+    """Orchestrate the download and append process for one series."""
+    print("=" * 80)
+    print(source.title)
+    print("=" * 80)
+    print(f"Timestamp: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+
+    # Download data (CSV), conditional on the ETag of the last processed payload
+    csv_content, etag = download_series(source, _read_etag(source))
+    if csv_content is NOT_MODIFIED:
+        print("✓ Tracker and exports are already up to date")
+        print()
+        print("=" * 80)
+        print("Process completed successfully!")
+        print("=" * 80)
+        return
+    if not isinstance(csv_content, bytes) or not csv_content:
+        print("Exiting due to download failure")
+        return
+
+    # Parse CSV and add date components
+    df = parse_csv_data(source, csv_content)
+    if df is None or df.is_empty():
+        print("Exiting due to parsing failure")
+        return
+
+    # Display sample data
+    display_sample_data(source, df)
+
+    # Append to existing data and get updated dataset
+    combined_df, has_new, tracker_saved = append_to_csv(source.tracker_file, df)
+
+    # Export to multiple formats
+    print("\n" + "=" * 80)
+    print("Exporting Data")
+    print("=" * 80)
+    exported = export_data(source, combined_df, changed=has_new)
+    # Only remember the ETag once its payload is reflected in the tracker and exports;
+    # otherwise the next run would get a 304 and never store the missing data
+    if tracker_saved and exported:
+        _save_etag(source, etag)
+
+    print()
+    print("=" * 80)
+    print("Process completed successfully!")
+    print("=" * 80)
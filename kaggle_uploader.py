@@ -23,19 +23,303 @@ Usage:
 """
 
 import contextlib
+import copy
+import functools
+import hashlib
 import io
 import json
 import os
+import random
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
-from kaggle.api.kaggle_api_extended import KaggleApi
+
+# kaggle (which authenticates as a side effect of being imported) and yaml are imported
+# where they are first needed, so --list, --dry-run and cached-config runs skip them
+if TYPE_CHECKING:
+    from kaggle.api.kaggle_api_extended import KaggleApi
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize `obj` as compact JSON bytes (only machines read the staged metadata)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Noisy Kaggle client output to drop: the token bug message from older kaggle versions
+# and upload-info load errors. One compiled alternation per stream, searched once per line.
+_TOKEN_BUG_NOISE = "KaggleObject.from_dict() got an unexpected keyword argument 'token'"
+_UPLOAD_INFO_NOISE = "Error while trying to load upload info"
+_STDERR_FILTER_RE = re.compile(f"{re.escape(_TOKEN_BUG_NOISE)}|{re.escape(_UPLOAD_INFO_NOISE)}")
+# On stdout any KaggleObject.from_dict() complaint is dropped, not just the token one
+_STDOUT_FILTER_RE = re.compile(
+    f"{re.escape(_UPLOAD_INFO_NOISE)}|{re.escape('KaggleObject.from_dict()')}"
+)
+
+# Written into every staging folder next to the files, so no upload file may use the name
+_METADATA_FILENAME = "dataset-metadata.json"
+
+# Map license strings from the config to Kaggle's identifiers
+_LICENSE_MAP = {
+    "MIT": "CC0-1.0",
+    "CC0": "CC0-1.0",
+}
+
+
+def _version_notes() -> str:
+    """Version notes stamped with the current UTC time."""
+    return f"Auto-update: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC"
+
+
+@functools.lru_cache(maxsize=100)
+def _cached_yaml(path: str, mtime_ns: int, size: int) -> Any:  # noqa: ARG001 - stat fields are the cache key
+    """Parse a YAML file; cached per (path, mtime, size) so edits are still picked up."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:  # PyYAML built without libyaml
+        print(
+            "⚠️  PyYAML has no libyaml bindings; parsing config with the slower pure-Python loader"
+        )
+        loader = yaml.SafeLoader
+    # Hand libyaml the raw bytes in one buffer rather than a stream it reads in chunks
+    return yaml.load(Path(path).read_bytes(), Loader=loader)  # nosec B506 - safe loader only
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` so readers only ever see the old or the complete new file."""
+    # Unique temp name per process and thread, since concurrent writers may target one path
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def _read_kaggle_json() -> dict[str, Any]:
+    """Contents of ~/.kaggle/kaggle.json, read once per process ({} if absent or unreadable)."""
+    try:
+        kaggle_file = Path.home() / ".kaggle" / "kaggle.json"
+        if kaggle_file.exists():
+            data = _loads_json(kaggle_file.read_bytes())
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass
+    return {}
+
+
+# None until _stage_file has tried a symlink; then True, or False after a failed one (the
+# platform or filesystem does not allow them) so later files go straight to the
+# hardlink/copy fallbacks
+_symlinks_supported: bool | None = None
+
+
+def _stage_file(src: Path, dest: Path) -> None:
+    """Place `src` at `dest` without reading it into memory.
+
+    Symlinks where the platform allows it (the Kaggle client only opens staged files for
+    reading, and open() follows links), then tries a hardlink, and finally copies into a
+    newly created file: `os.copy_file_range` where it works, otherwise `shutil.copyfileobj`.
+
+    `dest` must not exist. An existing `dest` may be a link to another project file, so
+    it is never opened for writing; FileExistsError is raised instead.
+    """
+    global _symlinks_supported
+    if _symlinks_supported is not False:
+        try:
+            os.symlink(os.path.abspath(src), dest)
+            _symlinks_supported = True
+            return
+        except FileExistsError:
+            # A name clash, not a platform limitation. Trying the next method would write
+            # through the existing link into the file it points at, so stop here
+            raise
+        except (OSError, NotImplementedError):
+            # e.g. Windows without symlink privilege: remember it instead of failing per file
+            _symlinks_supported = False
+    try:
+        os.link(src, dest)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass  # e.g. across filesystems: copy below
+    # "x" mode creates dest and fails if it already exists, so a copy can never write
+    # through a link into someone else's file
+    with open(src, "rb") as fsrc, open(dest, "xb") as fdst:
+        if not _copy_file_range(fsrc, fdst):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+def _copy_file_range(fsrc: io.BufferedReader, fdst: io.BufferedWriter) -> bool:
+    """Copy `fsrc` into the empty `fdst` in-kernel with `os.copy_file_range`.
+
+    Reflinks on Btrfs/XFS. Returns False if the call is unavailable or could not copy the
+    whole file; the caller then copies normally.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    remaining = os.fstat(src_fd).st_size
+    try:
+        while remaining > 0 and (copied := os.copy_file_range(src_fd, dst_fd, remaining)):
+            remaining -= copied
+    except OSError:
+        return False  # unsupported filesystem pair
+    return remaining <= 0
+
+
+def _scan_sizes(parent: str, names: set[str]) -> dict[str, int | OSError]:
+    """Sizes of the `names` entries of directory `parent`, from a single scandir pass.
+
+    A name that could not be stat'ed maps to its OSError, so one unreadable entry (a
+    dangling symlink, a file removed mid-scan) cannot hide the other files. Names absent
+    from the result are not in the directory, or the directory does not exist.
+    """
+    sizes: dict[str, int | OSError] = {}
+    try:
+        with os.scandir(parent) as it:
+            for e in it:
+                if e.name in names:
+                    try:
+                        sizes[e.name] = e.stat().st_size
+                    except OSError as err:
+                        sizes[e.name] = err
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    except OSError as err:  # e.g. PermissionError on the directory itself
+        sizes.update(dict.fromkeys(names - sizes.keys(), err))
+    return sizes
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """Text stream that forwards writes to a per-thread target, or `default` when none is set.
+
+    Installed as sys.stdout/sys.stderr while datasets upload in parallel, so each worker
+    can capture its own output without redirecting the streams of the other workers.
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    @property
+    def target(self):
+        return getattr(self._local, "target", None) or self.default
+
+    @contextlib.contextmanager
+    def routed_to(self, stream):
+        previous = getattr(self._local, "target", None)
+        self._local.target = stream
+        try:
+            yield
+        finally:
+            self._local.target = previous
+
+    def write(self, s: str) -> int:
+        return self.target.write(s)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+
+def _current_stream(name: str):
+    """Return the stream `sys.<name>` currently writes to for this thread."""
+    stream = getattr(sys, name)
+    return stream.target if isinstance(stream, _ThreadRoutedStream) else stream
+
+
+@contextlib.contextmanager
+def _redirect(name: str, stream):
+    """Redirect `sys.<name>` to `stream` for this thread only when output is thread-routed."""
+    current = getattr(sys, name)
+    if isinstance(current, _ThreadRoutedStream):
+        with current.routed_to(stream):
+            yield
+    else:
+        redirect = contextlib.redirect_stdout if name == "stdout" else contextlib.redirect_stderr
+        with redirect(stream):
+            yield
+
+
+class _FilteredLineWriter(io.TextIOBase):
+    """Text stream that forwards complete lines to `target`, dropping matching ones."""
+
+    def __init__(
+        self,
+        target,
+        pattern: re.Pattern[str],
+        header: str | None = None,
+        skip_blank: bool = False,
+    ):
+        self._target = target
+        self._pattern = pattern
+        self._header = header
+        self._skip_blank = skip_blank
+        # Chunks of the current unfinished line; progress bars write many small pieces
+        # without a newline, and repeated str += on one growing line would be quadratic
+        self._pending: list[str] = []
+
+    def write(self, s: str) -> int:
+        if "\n" not in s:
+            self._pending.append(s)
+            return len(s)
+        self._pending.append(s)
+        *lines, tail = "".join(self._pending).split("\n")
+        self._pending = [tail] if tail else []
+        for line in lines:
+            self._emit(line)
+        return len(s)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def flush_pending(self) -> None:
+        """Emit a trailing partial line, if any."""
+        line = "".join(self._pending)
+        self._pending = []
+        if line:
+            self._emit(line)
+        self.flush()
+
+    def _emit(self, line: str) -> None:
+        if self._pattern.search(line):
+            return
+        if self._skip_blank and not line.strip():
+            return
+        if self._header:
+            self._target.write(f"{self._header}\n")
+            self._header = None
+        self._target.write(f"{line}\n")
 
 
 class KaggleUploader:
@@ -46,18 +330,36 @@ class KaggleUploader:
         config_path: str = "kaggle_config.yaml",
         dry_run: bool = False,
         confirm_yes: bool = False,
+        force: bool = False,
     ):
         """Initialize uploader with configuration.
 
         If `dry_run` is True, the uploader will not authenticate or call the Kaggle API;
-        it will only validate files and write dataset metadata to the temporary folder.
+        it will only validate files and build the dataset metadata, without staging anything.
+        If `force` is True, datasets are uploaded even when unchanged since the last upload.
         """
         self.config_path = Path(config_path)
-        self.config = self._load_config()
         self.dry_run = bool(dry_run)
+        self.config = self._load_config()
+        # Resolve the global upload settings once instead of on every lookup
+        self.upload_cfg: dict[str, Any] = self.config.get("upload") or {}
+        self._quiet: bool = self.upload_cfg.get("quiet", False)
+        self._is_public: bool = self.upload_cfg.get("is_public", True)
+        self._global_create_if_missing: bool = self.upload_cfg.get("create_if_missing", False)
         self.confirm_yes = bool(confirm_yes)
-        self.api = None if self.dry_run else self._initialize_kaggle_api()
+        self.force = bool(force)
+        # Stamp the version notes once per run: every dataset and retry reports the same time
+        self._version_notes = _version_notes()
+        self._thread_state = threading.local()
+        self._print_lock = threading.Lock()
         self.project_root = Path.cwd()
+        self._project_root_str = str(self.project_root)
+        # Resolve the uv launcher once rather than searching PATH for every pre-upload script
+        self._uv = shutil.which("uv") or "uv"
+        # Fingerprints of previous successful uploads (one file per Kaggle dataset id), used
+        # to skip unchanged datasets
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        self._state_dir = Path(cache_home) / "kaggle_uploader"
 
     def _load_config(self) -> dict[str, Any]:
         """Load and validate configuration file."""
@@ -65,17 +367,64 @@ class KaggleUploader:
             print(f"✗ Config file not found: {self.config_path}")
             sys.exit(1)
 
-        with open(self.config_path) as f:
-            return yaml.safe_load(f)
+        # A JSON sidecar of the parsed config is far cheaper to load than the YAML. Its first
+        # line records the YAML's mtime and size, and it is trusted only while both match.
+        # Dry runs bypass it so they always validate (and never touch) the real files.
+        st = self.config_path.stat()
+        cache_path = self.config_path.with_suffix(".cache.json")
+        cache_key = f"{st.st_mtime_ns}-{st.st_size}".encode()
+        if not self.dry_run:
+            try:
+                key, _, body = cache_path.read_bytes().partition(b"\n")
+                if key == cache_key:
+                    return _loads_json(body)
+            except (OSError, ValueError):
+                pass  # missing, unreadable or corrupt cache: reparse below
+
+        # The cached object is shared across instances; hand out a copy so callers can mutate it
+        config = copy.deepcopy(
+            _cached_yaml(str(self.config_path.resolve()), st.st_mtime_ns, st.st_size)
+        )
+        if not self.dry_run:
+            try:
+                # Only cache configs JSON reproduces exactly: the encoder rejects some YAML-only
+                # values (dates, ...) but silently stringifies int/bool/None mapping keys
+                dump = json.dumps(config)
+                if json.loads(dump) != config:
+                    raise ValueError("config does not round-trip through JSON")
+                _atomic_write_bytes(cache_path, cache_key + b"\n" + dump.encode())
+            except (OSError, TypeError, ValueError):
+                cache_path.unlink(missing_ok=True)
+        return config
+
+    @property
+    def api(self) -> "KaggleApi | None":
+        """Kaggle client for the current thread (None in dry-run mode).
+
+        Created on first use, so --list and uploads that fail validation never authenticate.
+        KaggleApi is not documented as thread-safe, so each upload worker thread
+        authenticates and keeps its own client.
+        """
+        if self.dry_run:
+            return None
+        api = getattr(self._thread_state, "api", None)
+        if api is None:
+            api = self._thread_state.api = self._initialize_kaggle_api()
+        return api
 
-    def _initialize_kaggle_api(self) -> KaggleApi:
+    def _initialize_kaggle_api(self) -> "KaggleApi":
         """Initialize Kaggle API with credentials."""
-        api = KaggleApi()
         try:
+            # Importing the kaggle package authenticates as a side effect, so a missing
+            # or broken credential can already fail here; newer clients report it via
+            # exit(1) rather than an exception
+            from kaggle.api.kaggle_api_extended import KaggleApi
+
+            api = KaggleApi()
             api.authenticate()
             print("✓ Kaggle API authenticated")
             return api
-        except Exception as e:
+        except (Exception, SystemExit) as e:
             print(f"✗ Failed to authenticate Kaggle API: {e}")
             print("\nSetup Instructions:")
             print("1. Create Kaggle account: https://kaggle.com")
@@ -84,156 +433,103 @@ class KaggleUploader:
             print("4. chmod 600 ~/.kaggle/kaggle.json")
             sys.exit(1)
 
+    def _create_if_missing(self, config: dict[str, Any]) -> bool:
+        """Whether a missing dataset may be created (dataset setting or global default)."""
+        return config.get("create_if_missing", False) or self._global_create_if_missing
+
     def _run_with_filtered_stderr(self, func):
-        """Run `func` while capturing stderr and filter known noisy Kaggle client warnings.
+        """Run `func` while filtering known noisy Kaggle client warnings from its output.
 
         Returns the value returned by `func`. If `func` raises, the exception is propagated.
-        Captures both stdout and stderr to handle Kaggle API file upload messages.
+        Both stdout and stderr are filtered line by line as they are written, so Kaggle API
+        file upload messages appear live and nothing is buffered beyond the current line.
         """
-        stderr_buf = io.StringIO()
-        stdout_buf = io.StringIO()
-
-        # Store original streams
-        original_stderr = sys.stderr
-        original_stdout = sys.stdout
+        stderr_filter = _FilteredLineWriter(
+            _current_stream("stderr"),
+            pattern=_STDERR_FILTER_RE,
+            header="[kaggle-client-stderr]:",
+        )
+        # Show normal file upload messages but skip error log lines and blank lines
+        stdout_filter = _FilteredLineWriter(
+            _current_stream("stdout"),
+            pattern=_STDOUT_FILTER_RE,
+            skip_blank=True,
+        )
 
         try:
-            # Redirect both stderr and stdout
-            sys.stderr = stderr_buf
-            sys.stdout = stdout_buf
-
-            # Also use contextlib for additional safety
-            with contextlib.redirect_stderr(stderr_buf):
-                result = func()
+            with _redirect("stderr", stderr_filter), _redirect("stdout", stdout_filter):
+                return func()
         finally:
-            # Restore original streams
-            sys.stderr = original_stderr
-            sys.stdout = original_stdout
-
-        # Process captured stderr
-        stderr_out = stderr_buf.getvalue()
-        if stderr_out:
-            # Filter out known benign warnings from kaggle client
-            filtered = []
-            for line in stderr_out.splitlines():
-                # Filter known token bug message from older kaggle versions and file upload errors
-                if any(
-                    pattern in line
-                    for pattern in [
-                        "KaggleObject.from_dict() got an unexpected keyword argument 'token'",
-                        "Error while trying to load upload info",
-                    ]
-                ):
-                    continue
-                filtered.append(line)
-
-            if filtered:
-                print("[kaggle-client-stderr]:")
-                for line in filtered:
-                    print(line)
-
-        # Process captured stdout - show normal file upload messages but filter error logs
-        stdout_out = stdout_buf.getvalue()
-        if stdout_out:
-            for line in stdout_out.splitlines():
-                # Skip error log lines that appeared during uploads
-                if any(
-                    pattern in line
-                    for pattern in [
-                        "Error while trying to load upload info",
-                        "KaggleObject.from_dict()",
-                    ]
-                ):
-                    continue
-                if line.strip():
-                    print(line)
-
-        return result
-
-    def _perform_version_or_create(self, tmpdir_path: Path, config: dict[str, Any]) -> None:
-        """Attempt to create a dataset version, and fall back to creating the dataset if allowed.
-
-        Raises the original exception if creation is not permitted or fails.
-        """
-        try:
-            self._run_with_filtered_stderr(
-                lambda: self.api.dataset_create_version(
-                    folder=str(tmpdir_path),
-                    version_notes=f"Auto-update: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC",
-                    quiet=self.config.get("upload", {}).get("quiet", False),
-                    convert_to_csv=False,
-                    delete_old_versions=True,
-                )
-            )
-            return
-        except Exception as e:
-            msg = str(e).lower()
-            create_if_missing = config.get("create_if_missing", False) or self.config.get(
-                "upload", {}
-            ).get("create_if_missing", False)
-
-            if create_if_missing and (
-                "not found" in msg
-                or "404" in msg
-                or "forbidden" in msg
-                or "forbidden" in str(e).lower()
-            ):
-                if not (self.confirm_yes or self.dry_run):
-                    raise RuntimeError(
-                        "Dataset creation required but not confirmed. Re-run with --yes to allow creation."
-                    ) from None
-
-                is_public = self.config.get("upload", {}).get("is_public", True)
-                self._run_with_filtered_stderr(
-                    lambda: self.api.dataset_create_new(
-                        folder=str(tmpdir_path),
-                        public=is_public,
-                        quiet=self.config.get("upload", {}).get("quiet", False),
-                    )
-                )
-                return
-
-            # Re-raise the original exception if we couldn't handle it
-            raise
+            stderr_filter.flush_pending()
+            stdout_filter.flush_pending()
 
     def list_datasets(self) -> None:
         """List all configured datasets."""
-        print("\n" + "=" * 80)
-        print("Configured Kaggle Datasets")
-        print("=" * 80)
+        # Build the listing up front and write it once rather than a print per line
+        lines = ["\n" + "=" * 80, "Configured Kaggle Datasets", "=" * 80]
 
         datasets = self.config.get("datasets", {})
         for name, config in datasets.items():
             status = "✓ ENABLED" if config.get("enabled") else "✗ DISABLED"
-            print(f"\n{status} | {name}")
-            print(f"  Title: {config.get('title')}")
-            print(f"  Kaggle: {config.get('kaggle_dataset')}")
-            print(f"  Files: {len(config.get('files', []))} file(s)")
-
-        print("\n" + "=" * 80)
-
-    def _collect_file_paths(self, files: list[str]) -> list[Path]:
-        """Validate files exist and print a summary. Returns list of Path objects."""
-        file_paths: list[Path] = []
-        for file in files:
-            file_path = self.project_root / file
-            if not file_path.exists():
+            lines.append(f"\n{status} | {name}")
+            lines.append(f"  Title: {config.get('title')}")
+            lines.append(f"  Kaggle: {config.get('kaggle_dataset')}")
+            lines.append(f"  Files: {len(config.get('files', []))} file(s)")
+
+        lines.append("\n" + "=" * 80)
+        print("\n".join(lines))
+
+    def _collect_file_paths(self, files: list[str]) -> list[tuple[Path, int]]:
+        """Validate files exist and print a summary. Returns (path, size in bytes) pairs."""
+        # Files share a handful of directories (csv/, json/, parquet/, ...): list each
+        # directory once and check membership, instead of probing every path separately.
+        # Directories are scanned concurrently so slow (network) filesystems overlap latency.
+        # Plain string paths keep this loop cheap; Path objects are built only for the result.
+        root = self._project_root_str
+        split = [os.path.split(os.path.join(root, file)) for file in files]
+        wanted: dict[str, set[str]] = {}
+        for parent, name in split:
+            wanted.setdefault(parent, set()).add(name)
+
+        if len(wanted) == 1:
+            sizes = {parent: _scan_sizes(parent, names) for parent, names in wanted.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(wanted))) as pool:
+                sizes = dict(
+                    zip(wanted, pool.map(_scan_sizes, wanted, wanted.values()), strict=True)
+                )
+
+        found: list[tuple[str, str, int]] = []
+        for file, (parent, name) in zip(files, split, strict=True):
+            size = sizes[parent].get(name)
+            if size is None:
                 print(f"✗ File not found: {file}")
                 continue
-            file_paths.append(file_path)
+            if isinstance(size, OSError):
+                print(f"✗ Cannot read file: {file} ({size.strerror or size})")
+                continue
+            found.append((file, os.path.join(parent, name), size))
 
-        if not file_paths:
+        if not found:
             return []
 
-        print(f"📦 Files to upload ({len(file_paths)}):")
-        for fp in file_paths:
-            size_mb = fp.stat().st_size / (1024 * 1024)
-            print(f"  • {fp.relative_to(self.project_root)} ({size_mb:.2f} MB)")
+        # One write for the whole summary instead of a print per file
+        print(
+            "\n".join(
+                [
+                    f"📦 Files to upload ({len(found)}):",
+                    *(f"  • {file} ({size / (1 << 20):.2f} MB)" for file, _, size in found),
+                ]
+            )
+        )
 
-        return file_paths
+        return [(Path(path), size) for _, path, size in found]
 
     def _resolve_image(self, config: dict[str, Any], metadata: dict) -> Path | None:
-        """Resolve image path relative to project root and update metadata.image to basename."""
+        """Resolve image path relative to project root and record it in the metadata.
+
+        Sets metadata.image to the image's basename and adds a resource entry for it.
+        """
         image_rel = config.get("image")
         if not image_rel:
             return None
@@ -241,6 +537,15 @@ class KaggleUploader:
         candidate = self.project_root / image_rel
         if candidate.exists():
             metadata["image"] = candidate.name
+            # Ensure image is represented in resources (if not already)
+            resources = metadata.setdefault("resources", [])
+            if all(r.get("path") != candidate.name for r in resources):
+                resources.append(
+                    {
+                        "path": candidate.name,
+                        "description": config.get("subtitle", "Thumbnail image"),
+                    }
+                )
             return candidate
 
         return None
@@ -267,71 +572,112 @@ class KaggleUploader:
             return pre.get("allow_fail", False)
 
         # Use uv run to properly handle script dependencies
-        cmd = ["uv", "run", str(script_path), *pre.get("args", [])]
+        cmd = [self._uv, "run", str(script_path), *pre.get("args", [])]
         print(f"⏳ Running pre-upload script: {' '.join(cmd)}")
-        try:
-            subprocess.run(cmd, check=True, cwd=str(self.project_root))
+        # During parallel uploads the script's output is captured so it lands in this
+        # dataset's block. It goes to an unnamed temp file rather than a pipe: the child
+        # writes into a fully buffered file and nothing has to drain it live.
+        capture = isinstance(sys.stdout, _ThreadRoutedStream)
+        with tempfile.TemporaryFile() if capture else contextlib.nullcontext() as output:
+            try:
+                # Scripts are non-interactive: give them no stdin so they never block on a pipe/tty
+                subprocess.run(
+                    cmd,
+                    check=True,
+                    cwd=self.project_root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=output,
+                    stderr=subprocess.STDOUT if capture else None,
+                    close_fds=True,
+                )
+                error = None
+            except subprocess.CalledProcessError as e:
+                error = e
+            if capture:
+                output.seek(0)
+                print(output.read().decode(errors="replace"), end="")
+
+        if error is None:
             print("✓ Pre-upload script completed successfully")
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"✗ Pre-upload script failed: {e}")
-            if pre.get("allow_fail", False):
-                print("→ Continuing despite pre-upload failure (allow_fail=True)")
-                return True
-            return False
+        print(f"✗ Pre-upload script failed: {error}")
+        if pre.get("allow_fail", False):
+            print("→ Continuing despite pre-upload failure (allow_fail=True)")
+            return True
+        return False
 
     def _print_dry_run_info(
-        self, metadata_file: Path, file_paths: list[Path], config: dict[str, Any], dataset_name: str
+        self,
+        metadata_json: bytes,
+        file_paths: list[Path],
+        config: dict[str, Any],
+        dataset_name: str,
     ) -> None:
-        print("-- DRY RUN -- no Kaggle API calls will be made")
-        print(f"Would create dataset metadata at: {metadata_file}")
-        print(f"Would upload files: {[p.name for p in file_paths]}")
-        create_if_missing = config.get("create_if_missing", False) or self.config.get(
-            "upload", {}
-        ).get("create_if_missing", False)
+        lines = [
+            "-- DRY RUN -- no Kaggle API calls will be made",
+            f"Would create dataset metadata: dataset-metadata.json ({len(metadata_json)} bytes)",
+            f"Would upload files: {[p.name for p in file_paths]}",
+        ]
+        create_if_missing = self._create_if_missing(config)
         if create_if_missing:
-            print(
+            lines.append(
                 f"Would attempt to create dataset if missing: create_if_missing={create_if_missing}"
             )
-        print(f"✓ Dry run completed for: {dataset_name}")
+        lines.append(f"✓ Dry run completed for: {dataset_name}")
+        print("\n".join(lines))
 
     def _prepare_upload_folder(
         self,
         tmpdir_path: Path,
         file_paths: list[Path],
         image_path: Path | None,
-        metadata: dict,
-        config: dict,
+        metadata_json: bytes,
     ) -> Path:
-        """Copy files (and optional image) into `tmpdir_path`, update metadata resources, write metadata file, and return its path."""
-        # Copy files
-        for file_path in file_paths:
-            dest = tmpdir_path / file_path.name
-            dest.write_bytes(file_path.read_bytes())
-
-        # Copy image if present
-        if image_path:
-            img_dest = tmpdir_path / image_path.name
-            img_dest.write_bytes(image_path.read_bytes())
-            # Ensure image is represented in resources (if not already)
-            existing_paths = [r.get("path") for r in metadata.get("resources", [])]
-            if image_path.name not in existing_paths:
-                metadata.setdefault("resources", []).append(
-                    {
-                        "path": image_path.name,
-                        "description": config.get("subtitle", "Thumbnail image"),
-                    }
-                )
+        """Stage files (and optional image) into `tmpdir_path`, write the serialized metadata, and return its path."""
+        # Stage files (and the image, if present). Usually these are just links, but when
+        # they have to be copied, overlapping the copies keeps the disk busy
+        sources = [*file_paths, image_path] if image_path else file_paths
+        # Everything lands flat in one folder, so two sources with the same file name
+        # would collide; refuse up front rather than letting one replace the other
+        by_name: dict[str, list[Path]] = {}
+        for src in sources:
+            by_name.setdefault(src.name, []).append(src)
+        clashes = {name: srcs for name, srcs in by_name.items() if len(srcs) > 1}
+        if _METADATA_FILENAME in by_name:
+            clashes[_METADATA_FILENAME] = by_name[_METADATA_FILENAME]
+        if clashes:
+            details = "; ".join(
+                f"{name}: {', '.join(os.path.relpath(p, self.project_root) for p in srcs)}"
+                for name, srcs in clashes.items()
+            )
+            raise ValueError(
+                f"Upload files must have unique file names other than {_METADATA_FILENAME} ({details})"
+            )
+
+        def stage(src: Path) -> None:
+            try:
+                _stage_file(src, tmpdir_path / src.name)
+            except FileExistsError:
+                # Only reachable if the folder changed under us; never overwrite
+                raise ValueError(f"Refusing to stage {src}: {src.name} is already staged") from None
+
+        # The clash check above runs before any staging starts, so the outcome does not
+        # depend on which worker thread gets to a name first
+        if len(sources) == 1:
+            stage(sources[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(sources))) as pool:
+                list(pool.map(stage, sources))
 
-        # Write dataset metadata
-        metadata_file = tmpdir_path / "dataset-metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        # Write dataset metadata ("x": a fresh file, never through a staged link)
+        metadata_file = tmpdir_path / _METADATA_FILENAME
+        with open(metadata_file, "xb") as f:
+            f.write(metadata_json)
 
         return metadata_file
 
-    def upload_dataset(self, dataset_name: str | None = None) -> None:
-        """Upload dataset(s) to Kaggle."""
+    def upload_dataset(self, dataset_name: str | None = None, jobs: int = 1) -> None:
+        """Upload dataset(s) to Kaggle, up to `jobs` datasets at a time."""
         datasets = self.config.get("datasets", {})
 
         if dataset_name:
@@ -348,16 +694,49 @@ class KaggleUploader:
             print("✗ No enabled datasets found")
             sys.exit(1)
 
-        for dataset_name, config in datasets_to_upload.items():
-            self._upload_single_dataset(dataset_name, config)
+        if len(datasets_to_upload) == 1 or jobs <= 1:
+            for dataset_name, config in datasets_to_upload.items():
+                self._upload_single_dataset(dataset_name, config)
+            return
+
+        # Uploads are network-bound and independent, so run them concurrently. Each worker
+        # buffers its own output and prints it as one block when its dataset finishes
+        stdout = _ThreadRoutedStream(sys.stdout)
+        stderr = _ThreadRoutedStream(sys.stderr)
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+            ThreadPoolExecutor(max_workers=min(jobs, len(datasets_to_upload))) as executor,
+        ):
+            futures = [
+                executor.submit(self._upload_single_dataset_buffered, name, config, stdout, stderr)
+                for name, config in datasets_to_upload.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _upload_single_dataset_buffered(
+        self,
+        dataset_name: str,
+        config: dict[str, Any],
+        stdout: _ThreadRoutedStream,
+        stderr: _ThreadRoutedStream,
+    ) -> None:
+        """Upload one dataset on a worker thread, emitting its output as a single block."""
+        buf = io.StringIO()
+        try:
+            with stdout.routed_to(buf), stderr.routed_to(buf):
+                self._upload_single_dataset(dataset_name, config)
+        finally:
+            with self._print_lock:
+                stdout.default.write(buf.getvalue())
+                stdout.default.flush()
 
     def _try_create_dataset_as_fallback(
         self, tmpdir_path: Path, dataset_name: str, kaggle_slug: str, config: dict[str, Any]
     ) -> bool:
         """Try creating dataset as fallback. Returns True if successful."""
-        create_if_missing = config.get("create_if_missing", False) or self.config.get(
-            "upload", {}
-        ).get("create_if_missing", False)
+        create_if_missing = self._create_if_missing(config)
 
         if not create_if_missing:
             print(
@@ -372,8 +751,8 @@ class KaggleUploader:
             return False
 
         print("⚠️  Version creation failed — attempting to create dataset as fallback...")
-        is_public = self.config.get("upload", {}).get("is_public", True)
-        quiet = self.config.get("upload", {}).get("quiet", False)
+        is_public = self._is_public
+        quiet = self._quiet
         try:
             self._run_with_filtered_stderr(
                 lambda is_public=is_public, quiet=quiet: self._create_new_dataset(
@@ -393,27 +772,29 @@ class KaggleUploader:
         dataset_name: str,
         image_path: Path | None = None,
         config: dict[str, Any] | None = None,
-    ) -> None:
-        """Handle Kaggle API upload (version creation or dataset creation) with retry logic."""
+    ) -> bool:
+        """Handle Kaggle API upload (version creation or dataset creation) with retry logic.
+
+        Returns True once a version (or the fallback dataset) has been created.
+        """
         max_retries = 5
         retry_delay = 10  # seconds
-        quiet = self.config.get("upload", {}).get("quiet", False)
+        quiet = self._quiet
+        version_notes = self._version_notes
         config = config or {}
-        create_if_missing = config.get("create_if_missing", False) or self.config.get(
-            "upload", {}
-        ).get("create_if_missing", False)
+        create_if_missing = self._create_if_missing(config)
 
         for attempt in range(1, max_retries + 1):
             try:
                 self._run_with_filtered_stderr(
-                    lambda quiet=quiet: self._create_dataset_version(tmpdir_path, quiet)
+                    lambda: self._create_dataset_version(tmpdir_path, quiet, version_notes)
                 )
                 print(f"✓ Successfully uploaded: {dataset_name}")
 
                 if image_path:
                     self._upload_header_image(tmpdir_path, image_path)
 
-                return
+                return True
             except Exception as e:
                 error_msg = str(e).lower()
                 missing_error = (
@@ -432,13 +813,13 @@ class KaggleUploader:
                         if self._try_create_dataset_as_fallback(
                             tmpdir_path, dataset_name, kaggle_slug, config
                         ):
-                            return
+                            return True
                     else:
                         print(
                             "⚠️  Dataset not found and auto-creation is disabled. Set `create_if_missing: true` in config or upload.create_if_missing to enable fallback."
                         )
                         print(f"✗ Upload failed: {dataset_name} - {e}")
-                        return
+                        return False
 
                 # On transient server errors (5xx), keep retrying version creation
                 is_transient = (
@@ -451,23 +832,26 @@ class KaggleUploader:
 
                 if is_transient:
                     if attempt < max_retries:
-                        wait_time = retry_delay * attempt
+                        # Exponential backoff, capped, with jitter so parallel uploads
+                        # hitting the same outage do not retry in lockstep
+                        wait_time = min(60, retry_delay * 2 ** (attempt - 1))
+                        wait_time += random.uniform(0, 1)
                         print(
-                            f"⚠️  Transient server error (attempt {attempt}/{max_retries}). Retrying in {wait_time}s..."
+                            f"⚠️  Transient server error (attempt {attempt}/{max_retries}). Retrying in {wait_time:.1f}s..."
                         )
                         time.sleep(wait_time)
                     else:
                         # Final attempt failed
                         print(f"✗ Upload failed: {dataset_name} - {e}")
-                        return
+                        return False
                 else:
                     # Non-transient error, don't retry
                     print(f"✗ Upload failed: {dataset_name} - {e}")
-                    return
+                    return False
+        return False
 
-    def _create_dataset_version(self, tmpdir_path: Path, quiet: bool) -> None:
+    def _create_dataset_version(self, tmpdir_path: Path, quiet: bool, version_notes: str) -> None:
         """Create a new dataset version on Kaggle."""
-        version_notes = f"Auto-update: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC"
         self.api.dataset_create_version(
             folder=str(tmpdir_path),
             version_notes=version_notes,
@@ -479,7 +863,7 @@ class KaggleUploader:
     def _upload_header_image(self, tmpdir_path: Path, image_path: Path) -> None:
         """Upload header/thumbnail image to Kaggle dataset."""
         try:
-            metadata_file = tmpdir_path / "dataset-metadata.json"
+            metadata_file = tmpdir_path / _METADATA_FILENAME
             if not metadata_file.exists():
                 print("⚠️  Metadata file not found, skipping header image upload")
                 return
@@ -495,62 +879,6 @@ class KaggleUploader:
         except Exception as e:
             print(f"⚠️  Failed to upload header image: {e}")
 
-    def _handle_upload_error(
-        self,
-        error: Exception,
-        tmpdir_path: Path,
-        kaggle_slug: str,
-        config: dict[str, Any],
-        dataset_name: str,
-    ) -> None:
-        """Handle upload error with fallback to dataset creation if configured."""
-        msg = str(error).lower()
-        create_if_missing = config.get("create_if_missing", False) or self.config.get(
-            "upload", {}
-        ).get("create_if_missing", False)
-
-        if create_if_missing and ("not found" in msg or "404" in msg or "forbidden" in msg):
-            print("⚠️  Dataset version creation failed — attempting to create dataset...")
-            max_retries = 2
-            is_public_val: bool = self.config.get("upload", {}).get("is_public", True)
-            quiet_val: bool = self.config.get("upload", {}).get("quiet", False)
-
-            for attempt in range(1, max_retries + 1):
-                try:
-                    if not (self.confirm_yes or self.dry_run):
-                        print(
-                            "✗ Dataset creation required but not confirmed. Re-run with `--yes` to allow creation."
-                        )
-                        return
-
-                    self._run_with_filtered_stderr(
-                        lambda is_public_val=is_public_val, quiet_val=quiet_val: (
-                            self._create_new_dataset(tmpdir_path, is_public_val, quiet_val)
-                        )
-                    )
-                    print(f"✓ Dataset created: {dataset_name} ({kaggle_slug})")
-                    return
-                except Exception as e2:
-                    error_msg2 = str(e2).lower()
-                    # Retry on transient errors
-                    if (
-                        "500" in error_msg2
-                        or "502" in error_msg2
-                        or "503" in error_msg2
-                        or "504" in error_msg2
-                        or "internal" in error_msg2
-                    ) and attempt < max_retries:
-                        print(
-                            f"⚠️  Transient server error during creation (attempt {attempt}/{max_retries}). Retrying in 5s..."
-                        )
-                        time.sleep(5)
-                        continue
-                    print(f"✗ Failed to create dataset: {e2}")
-                    print(f"✗ Original error: {error}")
-                    return
-        else:
-            print(f"✗ Upload failed: {dataset_name} - {error}")
-
     def _create_new_dataset(self, tmpdir_path: Path, is_public: bool, quiet: bool) -> None:
         """Create a new dataset on Kaggle."""
         self.api.dataset_create_new(
@@ -560,11 +888,20 @@ class KaggleUploader:
         )
 
     def _get_dataset_exists(self, kaggle_dataset: str) -> bool:
-        """Check if a Kaggle dataset exists by trying to list its files."""
+        """Check if a Kaggle dataset exists by trying to list its files.
+
+        Authentication failures propagate instead of being read as a missing dataset.
+        """
+        # This is usually the first API use of a run, so authenticate outside the try
+        api = self.api
         try:
-            self.api.dataset_list_files(kaggle_dataset)
+            api.dataset_list_files(kaggle_dataset)
             return True
-        except Exception:
+        except Exception as e:
+            error_msg = str(e).lower()
+            # Rejected credentials must not fall through to create-if-missing
+            if "401" in error_msg or "unauthorized" in error_msg:
+                raise
             return False
 
     def _ensure_dataset_exists(
@@ -580,9 +917,7 @@ class KaggleUploader:
             print(f"✓ Dataset exists: {kaggle_dataset}")
             return True
 
-        create_if_missing = config.get("create_if_missing", False) or self.config.get(
-            "upload", {}
-        ).get("create_if_missing", False)
+        create_if_missing = self._create_if_missing(config)
 
         if not create_if_missing:
             print(
@@ -598,8 +933,8 @@ class KaggleUploader:
             return False
 
         print(f"⚠️  Creating new dataset: {dataset_name} ({kaggle_dataset})...")
-        is_public = self.config.get("upload", {}).get("is_public", True)
-        quiet = self.config.get("upload", {}).get("quiet", False)
+        is_public = self._is_public
+        quiet = self._quiet
         try:
             self._run_with_filtered_stderr(
                 lambda is_public=is_public, quiet=quiet: self._create_new_dataset(
@@ -616,9 +951,7 @@ class KaggleUploader:
 
     def _upload_single_dataset(self, dataset_name: str, config: dict[str, Any]) -> None:
         """Upload a single dataset to Kaggle."""
-        print(f"\n{'=' * 80}")
-        print(f"Uploading: {dataset_name}")
-        print(f"{'=' * 80}")
+        print(f"\n{'=' * 80}\nUploading: {dataset_name}\n{'=' * 80}")
 
         kaggle_slug = config.get("kaggle_slug")
         kaggle_dataset = config.get("kaggle_dataset")
@@ -628,45 +961,121 @@ class KaggleUploader:
             print("✗ Aborting upload due to pre-upload script failure")
             return
 
-        file_paths = self._collect_file_paths(files)
-        if not file_paths:
+        found = self._collect_file_paths(files)
+        if not found:
             print("✗ No valid files found for upload")
             return
+        file_paths = [path for path, _ in found]
 
         metadata = self._create_metadata(dataset_name, config)
 
-        image_rel = config.get("image")
-        image_path = None
-        if image_rel:
-            candidate = self.project_root / image_rel
-            if candidate.exists():
-                image_path = candidate
-                metadata["image"] = image_path.name
+        image_path = self._resolve_image(config, metadata)
+
+        # Serialize once: the same bytes feed the fingerprint and the staged metadata file
+        metadata_json = _dumps_json(metadata)
+
+        if self.dry_run:
+            # Pure validation: report the plan without hashing, staging or writing anything
+            self._print_dry_run_info(metadata_json, file_paths, config, dataset_name)
+            return
 
+        # Skip the upload entirely when nothing that would be sent has changed since the
+        # last successful upload of this dataset; if the fingerprint cannot be computed
+        # (unreadable file, file outside the project root), just upload
+        dataset_id = metadata["id"]
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-                self._prepare_upload_folder(tmpdir_path, file_paths, image_path, metadata, config)
+            fingerprint = self._upload_fingerprint(file_paths, image_path, metadata_json)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not fingerprint upload, uploading without change detection: {e}")
+            fingerprint = None
+        if (
+            fingerprint is not None
+            and not self.force
+            and self._last_fingerprint(dataset_id) == fingerprint
+        ):
+            print(
+                f"✓ No changes since last upload, skipping: {dataset_name} (--force to upload anyway)"
+            )
+            return
 
-                if self.dry_run:
-                    self._print_dry_run_info(
-                        tmpdir_path / "dataset-metadata.json", file_paths, config, dataset_name
+        try:
+            staging_root = self._staging_root(sum(size for _, size in found))
+            with tempfile.TemporaryDirectory(dir=staging_root, prefix=".kaggle_upload_") as tmpdir:
+                tmpdir_path = Path(tmpdir)
+                self._prepare_upload_folder(tmpdir_path, file_paths, image_path, metadata_json)
+
+                if (
+                    self._process_existing_dataset(
+                        tmpdir_path,
+                        kaggle_slug,
+                        kaggle_dataset,
+                        dataset_name,
+                        image_path,
+                        config,
                     )
-                    return
-
-                self._process_existing_dataset(
-                    tmpdir_path,
-                    kaggle_slug,
-                    kaggle_dataset,
-                    dataset_name,
-                    image_path,
-                    config,
-                )
+                    and fingerprint is not None
+                ):
+                    self._record_upload(dataset_id, fingerprint)
 
         except Exception as e:
             print(f"✗ Upload failed: {e}")
             return
 
+    def _staging_root(self, total_size: int) -> Path:
+        """Pick where to create the staging folder for `total_size` bytes of files.
+
+        On Linux, /dev/shm keeps the short-lived staging writes in RAM: with symlink staging
+        that is only the metadata file and the links, otherwise it is full copies, so it is
+        used only while they fit in half of its free space. Until a symlink has actually been
+        staged, full copies are assumed, so a failed symlink cannot fill the tmpfs. Elsewhere
+        (or when they would not fit) stage inside the project, whose filesystem allows
+        hardlinks instead of copies.
+        """
+        shm = "/dev/shm"
+        if sys.platform == "linux" and os.path.isdir(shm):
+            try:
+                st = os.statvfs(shm)
+                needed = 1 << 20 if _symlinks_supported is True else total_size
+                if needed < st.f_bavail * st.f_frsize * 0.5:
+                    return Path(shm)
+            except OSError:
+                pass
+        return self.project_root
+
+    def _upload_fingerprint(
+        self, file_paths: list[Path], image_path: Path | None, metadata_json: bytes
+    ) -> str:
+        """SHA-256 over the serialized metadata and the name and contents of every file to upload."""
+        h = hashlib.sha256(metadata_json)
+        for path in [*file_paths, image_path] if image_path else file_paths:
+            h.update(str(path.relative_to(self.project_root)).encode() + b"\0")
+            # file_digest hashes straight from the file into OpenSSL (SHA-NI where the CPU
+            # has it) using a reused buffer, with no per-chunk bytes objects
+            with open(path, "rb", buffering=0) as f:
+                h.update(hashlib.file_digest(f, "sha256").digest())
+        return h.hexdigest()
+
+    def _state_path(self, dataset_id: str) -> Path:
+        """Manifest file holding the last uploaded fingerprint of `dataset_id` (owner/slug)."""
+        return self._state_dir / f"{dataset_id.replace('/', '__')}.json"
+
+    def _last_fingerprint(self, dataset_id: str) -> str | None:
+        """Fingerprint of the last successful upload of `dataset_id`, if one was recorded."""
+        try:
+            return _loads_json(self._state_path(dataset_id).read_bytes()).get("fingerprint")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _record_upload(self, dataset_id: str, fingerprint: str) -> None:
+        """Persist the fingerprint of a successful upload of `dataset_id` (atomically)."""
+        try:
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(
+                self._state_path(dataset_id), _dumps_json({"fingerprint": fingerprint})
+            )
+        except OSError as e:
+            print(f"⚠️  Could not save upload state: {e}")
+
     def _process_existing_dataset(
         self,
         tmpdir_path: Path,
@@ -675,8 +1084,11 @@ class KaggleUploader:
         dataset_name: str,
         image_path: Path | None,
         config: dict[str, Any],
-    ) -> None:
-        """Create or version the dataset once the upload folder is ready."""
+    ) -> bool:
+        """Create or version the dataset once the upload folder is ready.
+
+        Returns True if the dataset now holds the staged files.
+        """
         was_new = False
         if kaggle_dataset:
             already_exists = self._get_dataset_exists(kaggle_dataset)
@@ -684,15 +1096,15 @@ class KaggleUploader:
                 if not self._ensure_dataset_exists(
                     tmpdir_path, config, dataset_name, kaggle_dataset, image_path
                 ):
-                    return
+                    return False
                 was_new = True
 
         if was_new:
             print(f"✓ First-time upload complete: {dataset_name}")
-            return
+            return True
 
         print(f"\n📤 Creating new version for dataset ({kaggle_slug})...")
-        self._upload_to_kaggle(tmpdir_path, kaggle_slug, dataset_name, image_path, config)
+        return self._upload_to_kaggle(tmpdir_path, kaggle_slug, dataset_name, image_path, config)
 
     def _get_owner(self, config: dict[str, Any]) -> str:
         """Determine dataset owner with multiple fallbacks."""
@@ -706,8 +1118,21 @@ class KaggleUploader:
         if kaggle_dataset_full and "/" in kaggle_dataset_full:
             return kaggle_dataset_full.split("/")[0]
 
+        # 3-5. run-wide fallbacks, resolved once
+        owner = self._owner_fallback
+        if owner:
+            return owner
+
+        print(
+            "✗ Could not determine Kaggle owner — set `kaggle_owner` in dataset config or export KAGGLE_USERNAME or add upload.owner"
+        )
+        return ""
+
+    @functools.cached_property
+    def _owner_fallback(self) -> str:
+        """Owner from sources that do not vary per dataset ("" if none is set)."""
         # 3. global upload owner (upload.owner)
-        owner = self.config.get("upload", {}).get("owner")
+        owner = self.upload_cfg.get("owner")
         if owner:
             return owner
 
@@ -717,21 +1142,8 @@ class KaggleUploader:
             return owner
 
         # 5. username field from ~/.kaggle/kaggle.json
-        try:
-            kaggle_file = Path.home() / ".kaggle" / "kaggle.json"
-            if kaggle_file.exists():
-                with open(kaggle_file) as kf:
-                    data = json.load(kf)
-                    owner = data.get("username") or data.get("user")
-                    if owner:
-                        return owner
-        except Exception:
-            pass
-
-        print(
-            "✗ Could not determine Kaggle owner — set `kaggle_owner` in dataset config or export KAGGLE_USERNAME or add upload.owner"
-        )
-        return ""
+        data = _read_kaggle_json()
+        return data.get("username") or data.get("user") or ""
 
     def _build_resource_schema(self, config: dict[str, Any]) -> dict | None:
         """Build schema for resource fields."""
@@ -739,37 +1151,35 @@ class KaggleUploader:
         if not columns:
             return None
 
-        fields = []
-        for idx, col in enumerate(columns):
-            field = {
+        fields = [
+            {
                 "order": idx,
                 "name": col.get("name", ""),
                 "type": col.get("type", "string"),
                 "description": col.get("description", ""),
             }
-            fields.append(field)
-
+            for idx, col in enumerate(columns)
+        ]
         return {"fields": fields}
 
     def _build_resources(self, files: list[str], dataset_name: str, config: dict[str, Any]) -> list:
         """Build resources list with file descriptions (schema support disabled due to Kaggle API compatibility)."""
-        resources = []
+        # Descriptions may be keyed by the configured path or by the bare file name;
+        # flatten them once so each file costs plain dict lookups
+        desc_by_key = {
+            key: info.get("description")
+            for key, info in (config.get("file_info") or {}).items()
+            if info and info.get("description")
+        }
 
+        resources = []
         for full_path in files:
-            fname = Path(full_path).name
-            file_desc = (
-                config.get("file_info", {}).get(full_path, {}).get("description")
-                or config.get("file_info", {}).get(fname, {}).get("description")
-                or f"{dataset_name} - {fname}"
+            # Config paths are plain relative strings; basename avoids a Path object per file
+            fname = os.path.basename(full_path)
+            description = (
+                desc_by_key.get(full_path) or desc_by_key.get(fname) or f"{dataset_name} - {fname}"
             )
-
-            resource = {
-                "path": fname,
-                "description": file_desc,
-            }
-
-            resources.append(resource)
-
+            resources.append({"path": fname, "description": description})
         return resources
 
     def _create_metadata(self, dataset_name: str, config: dict[str, Any]) -> dict[str, Any]:
@@ -779,11 +1189,7 @@ class KaggleUploader:
 
         # Map license strings to Kaggle format
         license_str = config.get("license", "CC0-1.0")
-        license_map = {
-            "MIT": "CC0-1.0",
-            "CC0": "CC0-1.0",
-        }
-        license_name = license_map.get(license_str, license_str)
+        license_name = _LICENSE_MAP.get(license_str, license_str)
 
         # Build resources with file descriptions and schema
         resources = self._build_resources(files, dataset_name, config)
@@ -825,6 +1231,7 @@ Examples:
   python kaggle_uploader.py                              # Upload all enabled datasets
   python kaggle_uploader.py --dataset crude_oil_brent    # Upload specific dataset
   python kaggle_uploader.py --list                       # List all datasets
+  python kaggle_uploader.py --jobs 4                     # Upload up to 4 datasets at a time
         """,
     )
 
@@ -857,14 +1264,33 @@ Examples:
         help="Automatically confirm dataset creation (non-interactive)",
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Upload datasets even if nothing changed since their last upload",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of datasets to upload concurrently (default: 1, one at a time)",
+    )
+
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    uploader = KaggleUploader(config_path=args.config, dry_run=args.dry_run, confirm_yes=args.yes)
+    uploader = KaggleUploader(
+        config_path=args.config, dry_run=args.dry_run, confirm_yes=args.yes, force=args.force
+    )
 
     if args.list:
+        # Only needs the config: the Kaggle client is created on first API use, so listing
+        # never authenticates or touches the network
         uploader.list_datasets()
     else:
-        uploader.upload_dataset(dataset_name=args.dataset)
+        uploader.upload_dataset(dataset_name=args.dataset, jobs=args.jobs)
 
 
 if __name__ == "__main__":